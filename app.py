@@ -25,6 +25,14 @@ try:
 except ImportError:
     HAS_OPENPYXL = False
 
+# Optional fast CSV parsing (multithreaded C++ tokenizer)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
 LOGO_PATH = os.path.join(ASSETS_DIR, "logo.png")
 
@@ -109,6 +117,8 @@ class CSVFilterSortApp(QMainWindow):
         self.resize(1200, 720)
         self.theme_name = "dark"
         self.filter_editors: dict[int, QLineEdit] = {}
+        self._help_dialog: HelpDialog | None = None
+        self._help_dialog_theme = ""
         self._init_models()
         self._init_ui()
         self.apply_theme()
@@ -389,13 +399,47 @@ class CSVFilterSortApp(QMainWindow):
             except csv.Error:
                 delim = ","
 
+        if HAS_PYARROW:
+            try:
+                return self._read_delimited_arrow(path, encoding, delim)
+            except Exception:
+                pass  # ragged rows, odd encodings, etc. — use the Python reader
+
         with open(path, newline="", encoding=encoding) as fh:
             reader = csv.reader(fh, delimiter=delim)
-            data = list(reader)
-
-        if not data:
+            # Pull the header off the iterator so the row list is built
+            # in place — no full-file list followed by a data[1:] copy.
+            headers = next(reader, None)
+            if headers is None:
+                return [], []
+            return headers, list(reader)
+
+    def _read_delimited_arrow(self, path, encoding, delim):
+        """Parse a delimited file with pyarrow, keeping every column as text."""
+        with open(path, newline="", encoding=encoding) as fh:
+            headers = next(csv.reader(fh, delimiter=delim), None)
+        if not headers:
             return [], []
-        return data[0], data[1:]
+        table = pa_csv.read_csv(
+            path,
+            read_options=pa_csv.ReadOptions(
+                use_threads=True, encoding=encoding,
+                column_names=headers, skip_rows=1),
+            # Keep blank lines as empty rows, matching the csv.reader
+            # fallback — same file, same row count either way.
+            parse_options=pa_csv.ParseOptions(
+                delimiter=delim, ignore_empty_lines=False),
+            # Forcing string columns keeps cell text byte-identical to the
+            # csv.reader path (no "007" -> 7 type inference).
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in headers}),
+        )
+        columns = [
+            ["" if v is None else v for v in col.to_pylist()]
+            for col in table.columns
+        ]
+        rows = [list(r) for r in zip(*columns)]
+        return headers, rows
 
     def _read_excel(self, path):
         """Read .xlsx via openpyxl."""
@@ -457,6 +501,8 @@ class CSVFilterSortApp(QMainWindow):
     def _setup_column_filters(self, headers):
         self.filter_editors.clear()
         self.column_filter_bar.rebuild(headers)
+        # rebuild() disconnected the pooled inputs, so every input here
+        # is connection-free and safe to wire up exactly once.
         for i, inp in enumerate(self.column_filter_bar.inputs):
             col = i + 1
             inp.debounced_text.connect(
@@ -650,11 +696,11 @@ class CSVFilterSortApp(QMainWindow):
             QMessageBox.critical(self, "Error", f"Could not export:\n{e}")
 
     def _export_delimited(self, path, headers, rows_fn, delimiter):
-        with open(path, "w", newline="", encoding="utf-8") as f:
+        with open(path, "w", newline="", encoding="utf-8",
+                  buffering=1 << 20) as f:
             w = csv.writer(f, delimiter=delimiter)
             w.writerow(headers)
-            for row in rows_fn():
-                w.writerow(row)
+            w.writerows(rows_fn())
 
     def _export_json(self, path, headers, rows_fn):
         records = []
@@ -769,7 +815,13 @@ class CSVFilterSortApp(QMainWindow):
     # -----------------------------------------------------------------
 
     def show_help(self):
-        HelpDialog(self.theme_name, self).exec()
+        # Building the help content (dozens of styled labels) is the
+        # slow part of opening it; keep the dialog and re-show it,
+        # rebuilding only when the theme has changed underneath it.
+        if self._help_dialog is None or self._help_dialog_theme != self.theme_name:
+            self._help_dialog = HelpDialog(self.theme_name, self)
+            self._help_dialog_theme = self.theme_name
+        self._help_dialog.exec()
 
     def show_about(self):
         AboutDialog(self).exec()
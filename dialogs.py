@@ -1,16 +1,18 @@
 """DART dialog windows."""
 
 import csv
-from PySide6.QtCore import Qt, QPropertyAnimation, QObject, QThread, Signal
+from operator import itemgetter
+
+from PySide6.QtCore import Qt, QPropertyAnimation, QObject, QThread, QTimer, Signal
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QGraphicsOpacityEffect, QTableWidget, QTableWidgetItem,
+    QTableWidget, QTableWidgetItem,
     QHeaderView, QAbstractItemView, QFileDialog, QScrollArea,
     QWidget, QFrame, QGridLayout, QCheckBox,
 )
 
-from theme import THEMES, sys_font_family
+from theme import cached_font
 
 
 class BaseDialog(QDialog):
@@ -21,6 +23,8 @@ class BaseDialog(QDialog):
         self.setWindowTitle(title)
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setFixedSize(width, height)
+        self._pending_pos = None
+        self._move_pending = False
 
         self._outer = QVBoxLayout(self)
         self._outer.setContentsMargins(24, 20, 24, 20)
@@ -29,7 +33,7 @@ class BaseDialog(QDialog):
         if title:
             lbl = QLabel(title)
             lbl.setObjectName("dialogTitle")
-            lbl.setFont(QFont(sys_font_family(), 18, QFont.DemiBold))
+            lbl.setFont(cached_font(18, QFont.DemiBold))
             self._outer.addWidget(lbl)
 
         self.content_layout = QVBoxLayout()
@@ -43,12 +47,13 @@ class BaseDialog(QDialog):
         self._fade_in()
 
     def _fade_in(self):
-        self._opacity = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self._opacity)
-        self._anim = QPropertyAnimation(self._opacity, b"opacity")
+        # Animate window opacity rather than a QGraphicsOpacityEffect:
+        # the compositor blends it, so the dialog is not re-rendered
+        # into an offscreen pixmap on every frame.
+        self._anim = QPropertyAnimation(self, b"windowOpacity")
         self._anim.setDuration(200)
-        self._anim.setStartValue(0)
-        self._anim.setEndValue(1)
+        self._anim.setStartValue(0.0)
+        self._anim.setEndValue(1.0)
         self._anim.start()
 
     def add_close_button(self):
@@ -64,8 +69,21 @@ class BaseDialog(QDialog):
     def mouseMoveEvent(self, event):
         if hasattr(self, "_drag_pos"):
             delta = event.globalPosition().toPoint() - self._drag_pos
-            self.move(self.pos() + delta)
+            # Coalesce move events: apply at most one reposition per event
+            # loop turn instead of one per mouse-move. Accumulate onto the
+            # still-pending position, or earlier deltas would be lost.
+            base = self._pending_pos if self._move_pending else self.pos()
+            self._pending_pos = base + delta
             self._drag_pos = event.globalPosition().toPoint()
+            if not self._move_pending:
+                self._move_pending = True
+                QTimer.singleShot(0, self._apply_pending_move)
+
+    def _apply_pending_move(self):
+        self._move_pending = False
+        if self._pending_pos is not None:
+            self.move(self._pending_pos)
+            self._pending_pos = None
 
     def mouseReleaseEvent(self, event):
         if hasattr(self, "_drag_pos"):
@@ -81,7 +99,7 @@ class AboutDialog(BaseDialog):
         super().__init__(parent, title="", width=420, height=260)
 
         name = QLabel("DART")
-        name.setFont(QFont(sys_font_family(), 28, QFont.Bold))
+        name.setFont(cached_font(28, QFont.Bold))
         name.setAlignment(Qt.AlignCenter)
         self.content_layout.addWidget(name)
 
@@ -123,7 +141,6 @@ class AboutDialog(BaseDialog):
 class HelpDialog(BaseDialog):
     def __init__(self, theme_name="dark", parent=None):
         super().__init__(parent, title="Help", width=580, height=520)
-        t = THEMES[theme_name]
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -203,12 +220,10 @@ class HelpDialog(BaseDialog):
         self.content_layout.addWidget(scroll)
         self.add_close_button()
 
-        self._apply_help_styles(t)
-
     def _section(self, text):
         lbl = QLabel(text)
         lbl.setObjectName("helpSection")
-        lbl.setFont(QFont(sys_font_family(), 14, QFont.DemiBold))
+        lbl.setFont(cached_font(14, QFont.DemiBold))
         return lbl
 
     def _caption(self, text):
@@ -217,17 +232,6 @@ class HelpDialog(BaseDialog):
         lbl.setWordWrap(True)
         return lbl
 
-    def _apply_help_styles(self, t):
-        self.setStyleSheet(self.styleSheet() + f"""
-            QLabel#helpSection {{ color: {t['text_primary']}; }}
-            QLabel#helpCode {{
-                background: {t['bg_overlay']};
-                color: {t['accent']};
-                padding: 2px 6px;
-                border-radius: 4px;
-            }}
-        """)
-
 
 # -----------------------------------------------------------------------
 # Stats worker (runs on QThread)
@@ -268,14 +272,23 @@ class StatsWorker(QObject):
         cells_done = 0
         last_pct = -1
 
+        data = self._data
         for col_idx, hdr in enumerate(self._headers):
             nums: list[float] = []
             text_counts: dict[str, int] = {}
             text_display: dict[str, str] = {}
             unique_values: set[tuple[str, object]] = set()
-            for src_row in self._indices:
-                row_data = self._data[src_row]
-                cell = row_data[col_idx] if col_idx < len(row_data) else ""
+            # Slice the column once up front; itemgetter + map run the row
+            # indexing in C, with a guarded fallback for ragged rows.
+            get = itemgetter(col_idx)
+            try:
+                column = list(map(get, map(data.__getitem__, self._indices)))
+            except IndexError:
+                column = [
+                    data[i][col_idx] if col_idx < len(data[i]) else ""
+                    for i in self._indices
+                ]
+            for cell in column:
                 try:
                     num = float(cell)
                     nums.append(num)
@@ -355,9 +368,12 @@ class StatsDialog(BaseDialog):
         self._thread = None
         self._worker = None
 
-        self._headers = list(source_model.raw_headers())
+        # Shared by reference: the filter model swaps in a fresh indices
+        # list on every update rather than mutating in place, so the
+        # worker's snapshot stays consistent without an O(rows) copy.
+        self._headers = source_model.raw_headers()
         self._raw_data = source_model.raw_data()
-        self._visible_indices = list(proxy_model._visible_indices)
+        self._visible_indices = proxy_model._visible_indices
 
         # Text stats options
         opts = QHBoxLayout()
@@ -469,35 +485,36 @@ class StatsDialog(BaseDialog):
             "Most Common Text",
             "Most Common Count",
         ]
-        self.table.setRowCount(len(self._stats_data))
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
-        for r, row in enumerate(self._stats_data):
-            for c, val in enumerate(row):
-                self.table.setItem(r, c, QTableWidgetItem(val))
+        # Populate with updates and signals suspended so the view repaints
+        # once instead of once per item.
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            self.table.setRowCount(len(self._stats_data))
+            self.table.setColumnCount(len(headers))
+            self.table.setHorizontalHeaderLabels(headers)
+            for r, row in enumerate(self._stats_data):
+                for c, val in enumerate(row):
+                    self.table.setItem(r, c, QTableWidgetItem(val))
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
         self._fit_stats_columns(headers)
 
     def _fit_stats_columns(self, headers):
         """Size columns so header text stays readable without clipping."""
         hdr = self.table.horizontalHeader()
         hdr_metrics = hdr.fontMetrics()
-        cell_metrics = self.table.fontMetrics()
-        sample_rows = min(self.table.rowCount(), 250)
 
+        # Let Qt measure contents in one internal pass, then clamp so
+        # headers stay legible without extremely wide columns.
+        self.table.resizeColumnsToContents()
         for col, title in enumerate(headers):
-            width = hdr_metrics.horizontalAdvance(title) + 28
-            for row in range(sample_rows):
-                item = self.table.item(row, col)
-                if item is None:
-                    continue
-                txt = item.text()
-                if len(txt) > 120:
-                    txt = txt[:120]
-                width = max(width, cell_metrics.horizontalAdvance(txt) + 24)
-
-            # Keep headers legible while avoiding extremely wide columns.
-            width = max(84, min(width, 260))
-            self.table.setColumnWidth(col, width)
+            width = max(
+                self.table.columnWidth(col) + 16,
+                hdr_metrics.horizontalAdvance(title) + 28,
+            )
+            self.table.setColumnWidth(col, max(84, min(width, 260)))
             hdr.setSectionResizeMode(col, QHeaderView.Interactive)
 
         hdr.setStretchLastSection(False)
@@ -508,7 +525,8 @@ class StatsDialog(BaseDialog):
         if not path:
             return
         try:
-            with open(path, "w", newline="", encoding="utf-8") as f:
+            with open(path, "w", newline="", encoding="utf-8",
+                      buffering=1 << 20) as f:
                 w = csv.writer(f)
                 w.writerow([
                     "Column",
@@ -522,8 +540,7 @@ class StatsDialog(BaseDialog):
                     "Most Common Text",
                     "Most Common Count",
                 ])
-                for row in self._stats_data:
-                    w.writerow(row)
+                w.writerows(self._stats_data)
         except Exception as e:
             from PySide6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Could not export stats:\n{e}")
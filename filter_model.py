@@ -1,6 +1,9 @@
 """Filtered table model with background worker for large datasets."""
 
 import re
+import sys
+from array import array
+
 from PySide6.QtCore import (
     QAbstractTableModel, QModelIndex, QObject, Qt, QThread, Signal,
 )
@@ -10,80 +13,90 @@ from PySide6.QtCore import (
 # Module-level filter command logic (used by worker thread)
 # ---------------------------------------------------------------------------
 
-def _apply_command(cmd_text: str, cell: str) -> bool:
-    lc = cmd_text.lower()
-    if lc.startswith("range:"):
-        try:
-            parts = cmd_text[6:].strip().split(",")
-            if len(parts) != 2:
-                return False
-            lo, hi = float(parts[0]), float(parts[1])
-            return lo <= float(cell) <= hi
-        except Exception:
-            return False
-    elif lc.startswith("notrange:"):
-        try:
-            parts = cmd_text[9:].strip().split(",")
-            if len(parts) != 2:
-                return False
-            lo, hi = float(parts[0]), float(parts[1])
-            return not (lo <= float(cell) <= hi)
-        except Exception:
-            return False
-    elif lc.startswith("startswith:"):
-        return cell.lower().startswith(cmd_text[11:].strip().lower())
-    elif lc.startswith("contains:"):
-        return cmd_text[9:].strip().lower() in cell.lower()
-    elif lc.startswith("equals:"):
-        return cell.lower() == cmd_text[7:].strip().lower()
-    elif lc.startswith("endswith:"):
-        return cell.lower().endswith(cmd_text[9:].strip().lower())
-    elif lc.startswith("not:"):
-        return cmd_text[4:].strip().lower() not in cell.lower()
-    elif lc.startswith("regex:"):
-        try:
-            return bool(re.search(cmd_text[6:].strip(), cell, re.IGNORECASE))
-        except Exception:
-            return False
-    elif lc.startswith("in:"):
-        vals = [v.strip().lower() for v in cmd_text[3:].split(",")]
-        return cell.lower() in vals
+def _reject_all(cell: str) -> bool:
     return False
 
 
-def _row_accepted(row_data: list[str], column_filters: dict[int, str],
-                  global_text: str, col_count: int) -> bool:
-    """Return True if *row_data* passes all column filters + global search."""
-    for col, ft in column_filters.items():
-        if not ft:
-            continue
-        # col is 1-based (col-1 indexes into row_data)
-        idx = col - 1
-        if idx < 0 or idx >= len(row_data):
-            return False
-        cell = row_data[idx]
-        stripped = ft.strip()
-        if stripped.startswith("#"):
-            after_hash = stripped[1:].strip()
-            if ":" not in after_hash:
-                continue
-            cmd_name, _, arg = after_hash.partition(":")
-            if not arg.strip():
-                continue
-            if not _apply_command(after_hash, cell):
-                return False
-        else:
-            if stripped.lower() not in cell.lower():
-                return False
+def _c_range(arg: str, negate: bool = False):
+    parts = arg.split(",")
+    if len(parts) != 2:
+        return ("raw", _reject_all)
+    try:
+        lo, hi = float(parts[0]), float(parts[1])
+    except ValueError:
+        return ("raw", _reject_all)
+    # "float" predicates receive the pre-parsed column value
+    # (None for non-numeric cells), not the raw string.
+    if negate:
+        pred = lambda v, lo=lo, hi=hi: v is not None and not (lo <= v <= hi)
+    else:
+        pred = lambda v, lo=lo, hi=hi: v is not None and lo <= v <= hi
+    return ("float", pred)
+
+
+def _c_regex(arg: str):
+    try:
+        pat = re.compile(arg, re.IGNORECASE)
+    except re.error:
+        return ("raw", _reject_all)
+    return ("raw", lambda cell, search=pat.search: search(cell) is not None)
+
+
+_COMMAND_COMPILERS = {
+    "range": _c_range,
+    "notrange": lambda arg: _c_range(arg, negate=True),
+    "startswith": lambda arg: ("lower", lambda c, n=arg.lower(): c.startswith(n)),
+    "contains": lambda arg: ("lower", lambda c, n=arg.lower(): n in c),
+    "equals": lambda arg: ("lower", lambda c, n=arg.lower(): c == n),
+    "endswith": lambda arg: ("lower", lambda c, n=arg.lower(): c.endswith(n)),
+    "not": lambda arg: ("lower", lambda c, n=arg.lower(): n not in c),
+    "regex": _c_regex,
+    "in": lambda arg: ("lower", lambda c, vals=frozenset(
+        sys.intern(v.strip().lower()) for v in arg.split(",")): c in vals),
+}
+
+
+def _compile_filter(text: str):
+    """Compile a filter string into a ``(kind, predicate)`` pair.
+
+    ``kind`` names the cell form the predicate expects: ``"lower"`` for
+    lowercased text, ``"raw"`` for the original cell. Returns None when
+    the filter is empty or an incomplete command that matches every row.
+
+    Parsing the command, lowercasing the needle, and compiling any regex
+    happen once here instead of once per row in the scan loop.
+    """
+    stripped = text.strip()
+    if not stripped:
+        return None
+
+    if not stripped.startswith("#"):
+        needle = stripped.lower()
+        return ("lower", lambda cell, n=needle: n in cell)
+
+    after_hash = stripped[1:].strip()
+    if ":" not in after_hash:
+        return None
+    cmd, _, arg = after_hash.partition(":")
+    arg = arg.strip()
+    if not arg:
+        return None
+    compiler = _COMMAND_COMPILERS.get(cmd.lower())
+    if compiler is None:
+        # Unknown command — matches nothing, same as the old dispatch.
+        return ("raw", _reject_all)
+    return compiler(arg)
 
-    if global_text:
-        needle = global_text.lower()
-        for cell in row_data:
-            if needle in cell.lower():
-                return True
-        return False
 
-    return True
+def _compile_filters(column_filters: dict[int, str]) -> list[tuple]:
+    """Build [(data_col, kind, predicate), ...] for the active filters."""
+    compiled = []
+    for col, ft in column_filters.items():
+        spec = _compile_filter(ft)
+        if spec is not None:
+            # col is 1-based (col-1 indexes into row data)
+            compiled.append((col - 1, spec[0], spec[1]))
+    return compiled
 
 
 # ---------------------------------------------------------------------------
@@ -104,23 +117,160 @@ class FilterWorker(QObject):
         self._sort_col: int = 0
         self._sort_order: Qt.SortOrder = Qt.AscendingOrder
         self._generation: int = 0
+        # Caches derived from _data; rebuilt whenever the data object changes.
+        self._cached_data: list[list[str]] | None = None
+        self._sort_cache: dict[tuple[int, bool], list[int]] = {}
+        self._row_concat: list[str] | None = None
+        self._lower_cols: dict[int, list[str | None]] = {}
+        self._float_cols: dict[int, list[float | None]] = {}
+        self._col_masks: dict[int, tuple[str, bytearray, int]] = {}
+        self._global_cache: tuple[str, list[int]] | None = None
+
+    def _refresh_data_caches(self, data):
+        """Drop derived caches when a new dataset has been loaded."""
+        if data is not self._cached_data:
+            self._cached_data = data
+            self._sort_cache.clear()
+            self._row_concat = None
+            self._lower_cols.clear()
+            self._float_cols.clear()
+            self._col_masks.clear()
+            self._global_cache = None
+
+    def _get_lower_col(self, data, col: int) -> list[str | None]:
+        """Lazily built lowercased column; None marks rows too short.
+
+        Lowercasing each filtered cell once per dataset beats doing it on
+        every keystroke's full rescan. Values are interned: categorical
+        columns repeat heavily, so duplicates share storage and equals/in
+        checks can short-circuit on identity.
+        """
+        cached = self._lower_cols.get(col)
+        if cached is None:
+            intern = sys.intern
+            cached = [
+                intern(row[col].lower()) if 0 <= col < len(row) else None
+                for row in data
+            ]
+            self._lower_cols[col] = cached
+        return cached
+
+    def _get_float_col(self, data, col: int) -> list[float | None]:
+        """Lazily parsed numeric column; None for non-numeric cells.
+
+        Range filters then test pre-parsed floats instead of calling
+        float() on every cell for every keystroke.
+        """
+        cached = self._float_cols.get(col)
+        if cached is None:
+            cached = []
+            append = cached.append
+            for row in data:
+                if 0 <= col < len(row):
+                    try:
+                        v = float(row[col])
+                    except ValueError:
+                        append(None)
+                    else:
+                        # NaN compares unequal to everything, which would
+                        # scramble cached sort orders; treat it as text.
+                        append(None if v != v else v)
+                else:
+                    append(None)
+            self._float_cols[col] = cached
+        return cached
+
+    def _get_column_mask(self, data, data_col: int, text: str,
+                         kind: str, pred) -> tuple[bytearray, int]:
+        """Per-column acceptance mask, cached against the filter text.
+
+        Typing in one column box only rebuilds that column's mask; every
+        other active filter is a cached byte lookup per row instead of a
+        predicate call. The accept count is stored so masks can be probed
+        most-selective-first.
+        """
+        cached = self._col_masks.get(data_col)
+        if cached is not None and cached[0] == text:
+            return cached[1], cached[2]
+        if kind == "lower":
+            column = self._get_lower_col(data, data_col)
+            mask = bytearray(
+                cell is not None and pred(cell) for cell in column)
+        elif kind == "float":
+            mask = bytearray(map(pred, self._get_float_col(data, data_col)))
+        else:
+            mask = bytearray(
+                data_col < len(row) and pred(row[data_col]) for row in data)
+        count = sum(mask)
+        self._col_masks[data_col] = (text, mask, count)
+        return mask, count
+
+    def _get_row_concat(self, data) -> list[str]:
+        """Lazily built lowercased whole-row strings for global search.
+
+        One C-level substring test per row replaces up to col_count
+        per-cell lower() + `in` checks.
+        """
+        if self._row_concat is None:
+            self._row_concat = ["\t".join(row).lower() for row in data]
+        return self._row_concat
 
     def run_filter(self, generation: int):
         """Called via signal from main thread."""
         data = self._data
+        self._refresh_data_caches(data)
         col_filters = dict(self._column_filters)
         global_text = self._global_text
         sort_col = self._sort_col
         sort_order = self._sort_order
-        col_count = len(self._headers)
 
-        indices: list[int] = []
-        for i, row in enumerate(data):
-            # Check for stale generation every 50k rows
-            if i & 0xFFFF == 0 and generation != self._generation:
-                return
-            if _row_accepted(row, col_filters, global_text, col_count):
-                indices.append(i)
+        needle = global_text.lower() if global_text else ""
+        row_concat = self._get_row_concat(data) if needle else None
+        compiled = _compile_filters(col_filters)
+        # One cached mask per filtered column; only the column whose text
+        # changed is recomputed. Most-selective mask first so rejected
+        # rows bail out after one byte lookup in the common case.
+        masks = sorted(
+            (self._get_column_mask(data, c, col_filters[c + 1], kind, pred)
+             for c, kind, pred in compiled),
+            key=lambda pair: pair[1],
+        )
+        masks = [mask for mask, _ in masks]
+
+        # Resolve the global search first. While the user types, each
+        # needle extends the previous one, so the scan only revisits the
+        # rows that matched the shorter needle instead of the whole file.
+        if needle:
+            prev = self._global_cache
+            if prev is not None and prev[0] == needle:
+                hits = prev[1]
+            elif prev is not None and needle.startswith(prev[0]):
+                hits = [i for i in prev[1] if needle in row_concat[i]]
+            else:
+                hits = [i for i, blob in enumerate(row_concat) if needle in blob]
+            self._global_cache = (needle, hits)
+        else:
+            hits = None
+
+        if not masks:
+            indices = list(hits) if hits is not None else list(range(len(data)))
+        elif hits is None and len(masks) == 1:
+            # Single column filter, no global search — the everyday case
+            # of typing into one box. One pass over the mask just built.
+            indices = [i for i, ok in enumerate(masks[0]) if ok]
+        else:
+            candidates = hits if hits is not None else range(len(data))
+            indices = []
+            append = indices.append
+            for done, i in enumerate(candidates):
+                # Check for stale generation every 50k rows
+                if done & 0xFFFF == 0 and generation != self._generation:
+                    return
+                for mask in masks:
+                    if not mask[i]:
+                        break
+                else:
+                    append(i)
 
         # Check stale before sorting
         if generation != self._generation:
@@ -131,14 +281,31 @@ class FilterWorker(QObject):
             data_col = sort_col - 1
             reverse = sort_order == Qt.DescendingOrder
 
-            def sort_key(idx):
-                val = data[idx][data_col] if data_col < len(data[idx]) else ""
-                try:
-                    return (0, float(val))
-                except (ValueError, TypeError):
-                    return (1, val.lower())
-
-            indices.sort(key=sort_key, reverse=reverse)
+            # Sorting the full dataset once per (column, order) and
+            # filtering that cached order is O(n) per subsequent filter
+            # change instead of an O(n log n) re-sort.
+            order = self._sort_cache.get((data_col, reverse))
+            if order is None:
+                # Keys come from the typed column caches: floats were
+                # parsed and cells lowercased once per dataset, so
+                # building an order costs no per-row float()/lower().
+                floats = self._get_float_col(data, data_col)
+                lowers = self._get_lower_col(data, data_col)
+
+                def sort_key(idx):
+                    val = floats[idx]
+                    if val is not None:
+                        return (0, val)
+                    return (1, lowers[idx] or "")
+
+                order = sorted(range(len(data)), key=sort_key, reverse=reverse)
+                self._sort_cache[(data_col, reverse)] = order
+
+            if len(indices) == len(data):
+                indices = list(order)
+            else:
+                selected = set(indices)
+                indices = [i for i in order if i in selected]
         elif sort_col == 0 and sort_order == Qt.AscendingOrder:
             pass  # natural order, already correct
         elif sort_col == 0 and sort_order == Qt.DescendingOrder:
@@ -168,7 +335,9 @@ class FilteredTableModel(QAbstractTableModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._source = None
-        self._visible_indices: list[int] = []
+        # array('i') instead of list[int]: 4 bytes per visible row and
+        # contiguous storage, which matters on multi-million-row files.
+        self._visible_indices = array("i")
         self._column_filters: dict[int, str] = {}
         self._global_text: str = ""
         self._sort_col: int = 0
@@ -224,7 +393,12 @@ class FilteredTableModel(QAbstractTableModel):
     # -- Filter / sort API (called from main thread) --
 
     def setFilterForColumn(self, column: int, text: str):
-        self._column_filters[column] = text
+        # Cleared filters are dropped, not stored as empty strings, so
+        # the worker only compiles and copies entries that do something.
+        if text.strip():
+            self._column_filters[column] = text
+        else:
+            self._column_filters.pop(column, None)
         self._schedule_filter()
 
     def setGlobalFilter(self, text: str):
@@ -243,7 +417,7 @@ class FilteredTableModel(QAbstractTableModel):
         self._sort_col = 0
         self._sort_order = Qt.AscendingOrder
         if self._source is not None:
-            indices = list(range(len(self._source.raw_data())))
+            indices = array("i", range(len(self._source.raw_data())))
             self.beginResetModel()
             self._visible_indices = indices
             self.endResetModel()
@@ -268,7 +442,7 @@ class FilteredTableModel(QAbstractTableModel):
         if generation != self._generation:
             return  # stale result
         self.beginResetModel()
-        self._visible_indices = indices
+        self._visible_indices = array("i", indices)
         self.endResetModel()
 
     # -- Cleanup --
@@ -10,24 +10,28 @@ def _resolve_base_dir() -> str:
     if base:
         return base
 
-    # Fallback for non-frozen runs or unusual launchers.
+    # Fallback for unusual launchers without _MEIPASS.
     exe_dir = os.path.dirname(sys.executable)
     internal_dir = os.path.join(exe_dir, "_internal")
     return internal_dir if os.path.isdir(internal_dir) else exe_dir
 
 
-if sys.platform == "win32":
-    base_dir = _resolve_base_dir()
-    dll_dirs = [
-        base_dir,
-        os.path.join(base_dir, "PySide6"),
-        os.path.join(base_dir, "shiboken6"),
-    ]
-    for path in dll_dirs:
-        if not os.path.isdir(path):
+# Resolved once per process; the hook is a no-op outside frozen builds,
+# which also skips the fallback stat when running from source.
+if getattr(sys, "frozen", False) and sys.platform == "win32":
+    _BASE_DIR = _resolve_base_dir()
+
+    # One scandir pass instead of an isdir stat per candidate.
+    try:
+        subdirs = {e.name for e in os.scandir(_BASE_DIR) if e.is_dir()}
+    except OSError:
+        subdirs = set()
+
+    for name in ("", "PySide6", "shiboken6"):
+        if name and name not in subdirs:
             continue
         try:
-            os.add_dll_directory(path)
+            os.add_dll_directory(os.path.join(_BASE_DIR, name) if name else _BASE_DIR)
         except (AttributeError, OSError):
             # Ignore if unsupported or path registration fails.
             pass
@@ -6,6 +6,7 @@ Entry point with instant splash screen.
 
 import sys
 import os
+import time
 
 # Ensure the project root is on the path so local imports work.
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -30,18 +31,28 @@ def main():
     splash = SplashScreen(LOGO_PATH)
     splash.show()
     app.processEvents()
+    shown_at = time.monotonic()
 
-    # Import & build the heavy window after splash is visible
-    from app import CSVFilterSortApp
+    # Keeps the window alive for the lifetime of main()
+    holder = {}
 
-    window = CSVFilterSortApp()
+    def start_main():
+        # Import & build the heavy window only once the splash has
+        # actually painted; importing app pulls in chardet/openpyxl.
+        from app import CSVFilterSortApp
 
-    def finish():
-        window.show()
-        splash.fade_out()
+        holder["window"] = window = CSVFilterSortApp()
 
-    # Small delay so the splash is visible even on fast machines
-    QTimer.singleShot(600, finish)
+        def finish():
+            window.show()
+            splash.fade_out()
+
+        # Hand over as soon as the window is ready; only top up the
+        # delay when startup was so fast the splash would just flash.
+        elapsed_ms = int((time.monotonic() - shown_at) * 1000)
+        QTimer.singleShot(max(0, 300 - elapsed_ms), finish)
+
+    QTimer.singleShot(0, start_main)
 
     sys.exit(app.exec())
 
@@ -2,9 +2,7 @@
 
 from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
 from PySide6.QtGui import QFont, QPixmap, QPainter, QColor
-from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QGraphicsOpacityEffect, QApplication,
-)
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QApplication
 
 from theme import sys_font_family
 
@@ -63,11 +61,6 @@ class SplashScreen(QWidget):
         self._dots.setAlignment(Qt.AlignCenter)
         layout.addWidget(self._dots)
 
-        # Opacity for fade-out
-        self._opacity = QGraphicsOpacityEffect(self)
-        self._opacity.setOpacity(1.0)
-        self.setGraphicsEffect(self._opacity)
-
     def paintEvent(self, event):
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
@@ -76,7 +69,9 @@ class SplashScreen(QWidget):
         p.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 16, 16)
 
     def fade_out(self, on_done=None):
-        anim = QPropertyAnimation(self._opacity, b"opacity")
+        # Window-level opacity is composited on the GPU; a graphics
+        # effect would re-rasterize the widget tree every frame.
+        anim = QPropertyAnimation(self, b"windowOpacity")
         anim.setDuration(400)
         anim.setStartValue(1.0)
         anim.setEndValue(0.0)
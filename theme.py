@@ -1,6 +1,11 @@
 """DART color tokens and stylesheet builder."""
 
+import functools
 import platform
+import re
+from string import Template
+
+from PySide6.QtGui import QFont
 
 THEMES = {
     "dark": {
@@ -21,13 +26,9 @@ THEMES = {
         "row_alt":        "#121a1c",
         "row_hover":      "#1a2824",
         "selection_bg":   "rgba(58,171,78,0.18)",
-        "selection_text": "#e2e8e4",
         "header_bg":      "#151a1e",
-        "header_text":    "#8a9b90",
         "header_hover":   "#1b2228",
-        "scrollbar_bg":   "transparent",
-        "scrollbar_handle": "#2e3d33",
-        "scrollbar_hover":  "#3b4e42",
+        "overlay_veil":   "rgba(15,18,20,180)",
     },
     "light": {
         "bg_base":        "#f5f8f6",
@@ -47,18 +48,16 @@ THEMES = {
         "row_alt":        "#f0f5f1",
         "row_hover":      "#e6ede8",
         "selection_bg":   "rgba(47,146,64,0.12)",
-        "selection_text": "#141c16",
         "header_bg":      "#f0f5f1",
-        "header_text":    "#4e6252",
         "header_hover":   "#e2eae4",
-        "scrollbar_bg":   "transparent",
-        "scrollbar_handle": "#c4d1c7",
-        "scrollbar_hover":  "#a5b8a9",
+        "overlay_veil":   "rgba(245,248,246,200)",
     },
 }
 
 
+@functools.lru_cache(maxsize=1)
 def sys_font_family():
+    """Platform UI font; the platform can't change mid-process, so cached."""
     s = platform.system()
     if s == "Darwin":
         return ".AppleSystemUIFont"
@@ -67,194 +66,209 @@ def sys_font_family():
     return "Inter"
 
 
+@functools.lru_cache(maxsize=32)
+def cached_font(size: int, weight: int = -1) -> QFont:
+    """Shared QFont per (size, weight) — avoids a font-DB lookup per widget."""
+    if weight < 0:
+        return QFont(sys_font_family(), size)
+    return QFont(sys_font_family(), size, weight)
+
+
+_QSS_TEMPLATE = Template("""
+QMainWindow { background-color: $bg_base; }
+QWidget { background-color: transparent; color: $text_primary; }
+
+/* Menu bar */
+QMenuBar {
+    background-color: $bg_surface;
+    color: $text_secondary;
+    border-bottom: 1px solid $border_subtle;
+    padding: 2px 4px; font-size: 12px;
+}
+QMenuBar::item { background: transparent; padding: 4px 10px; border-radius: 4px; }
+QMenuBar::item:selected { background: $bg_overlay; color: $text_primary; }
+
+/* Menus */
+QMenu {
+    background-color: $bg_elevated;
+    border: 1px solid $border_default;
+    border-radius: 8px; padding: 4px;
+}
+QMenu::item { padding: 6px 28px 6px 12px; border-radius: 4px; color: $text_primary; }
+QMenu::item:selected { background-color: $accent_muted; }
+QMenu::separator { height: 1px; background: $border_subtle; margin: 4px 8px; }
+
+/* Tool bars (search / actions / column filters share one recipe) */
+QWidget#searchBar, QWidget#actionBar, QWidget#columnFilterBar {
+    background: $bg_surface;
+    border-bottom: 1px solid $border_subtle;
+}
+
+/* Search bar */
+QLineEdit#globalSearch {
+    background: $bg_elevated;
+    border: 1px solid $border_default;
+    border-radius: 8px; padding: 6px 14px;
+    font-size: 13px; color: $text_primary;
+    selection-background-color: $accent;
+}
+QLineEdit#globalSearch:focus { border: 1.5px solid $accent; }
+
+/* Action bar */
+QPushButton#actionButton {
+    background: transparent; border: none; border-radius: 6px;
+    padding: 4px 10px; font-size: 12px; font-weight: 500;
+    color: $text_secondary;
+}
+QPushButton#actionButton:hover { background: $bg_overlay; color: $text_primary; }
+QPushButton#actionButton:pressed { background: $border_subtle; }
+QFrame#toolSep { color: $border_subtle; background: $border_subtle; }
+
+/* Tables (main view + stats dialog) */
+QTableView, QTableWidget {
+    background-color: $bg_surface;
+    alternate-background-color: $row_alt;
+    color: $text_primary;
+    gridline-color: $border_subtle;
+    border: none; outline: none;
+}
+QTableView::item, QTableWidget::item {
+    padding: 0px 10px;
+    color: $text_primary;
+    border-bottom: 1px solid $border_subtle;
+}
+QTableView::item:hover { background-color: $row_hover; }
+QTableView::item:selected, QTableWidget::item:selected {
+    background-color: $selection_bg;
+    color: $text_primary;
+}
+QTableWidget { font-size: 13px; }
+
+/* Table header */
+QHeaderView { background-color: $header_bg; border: none; }
+QHeaderView::section {
+    background-color: $header_bg;
+    color: $text_secondary;
+    padding: 8px 10px; border: none;
+    border-bottom: 1px solid $border_default;
+    border-right: 1px solid $border_subtle;
+    font-size: 11px; font-weight: 600;
+}
+QHeaderView::section:hover { background-color: $header_hover; color: $text_primary; }
+
+/* Main content */
+QStackedWidget#contentStack, QWidget#dataPage, QWidget#emptyState {
+    background: $bg_surface;
+}
+
+/* Column filter inputs */
+QLineEdit#colFilter {
+    background: $bg_base; border: 1px solid $border_subtle;
+    border-radius: 4px; padding: 3px 6px; font-size: 11px;
+    color: $text_primary;
+}
+QLineEdit#colFilter:focus { border: 1px solid $accent; }
+
+/* Scrollbars */
+QScrollBar:vertical { background: transparent; width: 8px; margin: 0; border: none; }
+QScrollBar:horizontal { background: transparent; height: 8px; margin: 0; border: none; }
+QScrollBar::handle:vertical {
+    background: $border_default; min-height: 30px; border-radius: 4px;
+}
+QScrollBar::handle:horizontal {
+    background: $border_default; min-width: 30px; border-radius: 4px;
+}
+QScrollBar::handle:vertical:hover, QScrollBar::handle:horizontal:hover {
+    background: $border_strong;
+}
+QScrollBar::add-line, QScrollBar::sub-line { width: 0; height: 0; border: none; }
+QScrollBar::add-page, QScrollBar::sub-page { background: none; }
+
+/* Status bar */
+QStatusBar {
+    background: $bg_surface; color: $text_tertiary;
+    border-top: 1px solid $border_subtle;
+    font-size: 11px; padding: 2px 12px;
+}
+QStatusBar QLabel { color: $text_tertiary; font-size: 11px; padding: 0 8px; }
+
+/* General inputs */
+QLineEdit {
+    background: $bg_elevated; border: 1px solid $border_default;
+    border-radius: 6px; padding: 6px 10px;
+    color: $text_primary; selection-background-color: $accent;
+}
+QLineEdit:focus { border: 1.5px solid $accent; }
+
+/* General buttons */
+QPushButton {
+    background: $bg_elevated; border: 1px solid $border_default;
+    border-radius: 6px; padding: 6px 14px;
+    color: $text_primary; font-weight: 500;
+}
+QPushButton:hover { background: $bg_overlay; border-color: $border_strong; }
+QPushButton:pressed { background: $border_subtle; }
+QPushButton#primaryButton {
+    background: $accent; border: none; color: #ffffff;
+    border-radius: 8px; padding: 8px 20px; font-size: 13px; font-weight: 600;
+}
+QPushButton#primaryButton:hover { background: $accent_hover; }
+
+/* Dialogs */
+QDialog { background: $bg_elevated; }
+
+/* Tooltips */
+QToolTip {
+    background: $bg_elevated; color: $text_primary;
+    border: 1px solid $border_default; border-radius: 6px;
+    padding: 6px 10px; font-size: 12px;
+}
+
+/* Empty state */
+QLabel#emptyTitle { color: $text_secondary; font-size: 16px; }
+QLabel#emptyHint { color: $text_tertiary; font-size: 12px; }
+
+/* Dialog labels */
+QLabel#dialogTitle { color: $text_primary; }
+QLabel#helpSection { color: $text_primary; }
+QLabel#helpCode {
+    background: $bg_overlay; color: $accent;
+    padding: 2px 6px; border-radius: 4px;
+}
+QLabel#textSecondary { color: $text_secondary; font-size: 13px; }
+QLabel#textTertiary { color: $text_tertiary; font-size: 12px; }
+QLabel#versionPill {
+    background: $accent_muted; color: $accent;
+    border-radius: 10px; padding: 4px 12px; font-size: 11px; font-weight: 600;
+}
+
+/* Text browser */
+QTextBrowser {
+    background: $bg_surface; color: $text_primary;
+    border: none; font-size: 13px;
+}
+
+/* Loading overlay */
+QWidget#loadingOverlay { background: $overlay_veil; }
+QLabel#loadingText { color: $text_secondary; font-size: 14px; }
+""")
+
+
+def _minify(qss: str) -> str:
+    """Drop comments and collapse whitespace — same rules, fewer bytes
+    through Qt's stylesheet tokenizer on every setStyleSheet call."""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.S)
+    return re.sub(r"\s+", " ", qss).strip()
+
+
+# Both themes rendered once at import: substitute() fills every token
+# in a single pass, and the first setStyleSheet call at startup never
+# pays the formatting cost.
+_STYLESHEETS = {
+    name: _minify(_QSS_TEMPLATE.substitute(t)) for name, t in THEMES.items()
+}
+
+
 def build_stylesheet(theme: str) -> str:
-    t = THEMES[theme]
-    return f"""
-    QMainWindow {{ background-color: {t['bg_base']}; }}
-    QWidget {{ background-color: transparent; color: {t['text_primary']}; }}
-
-    /* Menu bar */
-    QMenuBar {{
-        background-color: {t['bg_surface']};
-        color: {t['text_secondary']};
-        border-bottom: 1px solid {t['border_subtle']};
-        padding: 2px 4px; font-size: 12px;
-    }}
-    QMenuBar::item {{ background: transparent; padding: 4px 10px; border-radius: 4px; }}
-    QMenuBar::item:selected {{ background: {t['bg_overlay']}; color: {t['text_primary']}; }}
-
-    /* Menus */
-    QMenu {{
-        background-color: {t['bg_elevated']};
-        border: 1px solid {t['border_default']};
-        border-radius: 8px; padding: 4px;
-    }}
-    QMenu::item {{ padding: 6px 28px 6px 12px; border-radius: 4px; color: {t['text_primary']}; }}
-    QMenu::item:selected {{ background-color: {t['accent_muted']}; }}
-    QMenu::separator {{ height: 1px; background: {t['border_subtle']}; margin: 4px 8px; }}
-
-    /* Search bar */
-    QWidget#searchBar {{
-        background: {t['bg_surface']};
-        border-bottom: 1px solid {t['border_subtle']};
-    }}
-    QLineEdit#globalSearch {{
-        background: {t['bg_elevated']};
-        border: 1px solid {t['border_default']};
-        border-radius: 8px; padding: 6px 14px;
-        font-size: 13px; color: {t['text_primary']};
-        selection-background-color: {t['accent']};
-    }}
-    QLineEdit#globalSearch:focus {{ border: 1.5px solid {t['accent']}; }}
-
-    /* Action bar */
-    QWidget#actionBar {{
-        background: {t['bg_surface']};
-        border-bottom: 1px solid {t['border_subtle']};
-    }}
-    QPushButton#actionButton {{
-        background: transparent; border: none; border-radius: 6px;
-        padding: 4px 10px; font-size: 12px; font-weight: 500;
-        color: {t['text_secondary']};
-    }}
-    QPushButton#actionButton:hover {{ background: {t['bg_overlay']}; color: {t['text_primary']}; }}
-    QPushButton#actionButton:pressed {{ background: {t['border_subtle']}; }}
-    QFrame#toolSep {{ color: {t['border_subtle']}; background: {t['border_subtle']}; }}
-
-    /* Table */
-    QTableView {{
-        background-color: {t['bg_surface']};
-        alternate-background-color: {t['row_alt']};
-        color: {t['text_primary']};
-        gridline-color: {t['border_subtle']};
-        border: none; outline: none;
-    }}
-    QTableView::item {{
-        padding: 0px 10px;
-        color: {t['text_primary']};
-        border-bottom: 1px solid {t['border_subtle']};
-    }}
-    QTableView::item:hover {{ background-color: {t['row_hover']}; }}
-    QTableView::item:selected {{
-        background-color: {t['selection_bg']};
-        color: {t['selection_text']};
-    }}
-
-    /* Table header */
-    QHeaderView {{ background-color: {t['header_bg']}; border: none; }}
-    QHeaderView::section {{
-        background-color: {t['header_bg']};
-        color: {t['header_text']};
-        padding: 8px 10px; border: none;
-        border-bottom: 1px solid {t['border_default']};
-        border-right: 1px solid {t['border_subtle']};
-        font-size: 11px; font-weight: 600;
-    }}
-    QHeaderView::section:hover {{ background-color: {t['header_hover']}; color: {t['text_primary']}; }}
-
-    /* Main content */
-    QStackedWidget#contentStack {{ background: {t['bg_surface']}; }}
-    QWidget#dataPage {{ background: {t['bg_surface']}; }}
-    QWidget#emptyState {{ background: {t['bg_surface']}; }}
-
-    /* Column filter bar */
-    QWidget#columnFilterBar {{ background: {t['bg_surface']}; border-bottom: 1px solid {t['border_subtle']}; }}
-    QLineEdit#colFilter {{
-        background: {t['bg_base']}; border: 1px solid {t['border_subtle']};
-        border-radius: 4px; padding: 3px 6px; font-size: 11px;
-        color: {t['text_primary']};
-    }}
-    QLineEdit#colFilter:focus {{ border: 1px solid {t['accent']}; }}
-
-    /* Scrollbars */
-    QScrollBar:vertical {{
-        background: {t['scrollbar_bg']}; width: 8px; margin: 0; border: none;
-    }}
-    QScrollBar::handle:vertical {{
-        background: {t['scrollbar_handle']}; min-height: 30px; border-radius: 4px;
-    }}
-    QScrollBar::handle:vertical:hover {{ background: {t['scrollbar_hover']}; }}
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0; border: none; }}
-    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background: none; }}
-    QScrollBar:horizontal {{
-        background: {t['scrollbar_bg']}; height: 8px; margin: 0; border: none;
-    }}
-    QScrollBar::handle:horizontal {{
-        background: {t['scrollbar_handle']}; min-width: 30px; border-radius: 4px;
-    }}
-    QScrollBar::handle:horizontal:hover {{ background: {t['scrollbar_hover']}; }}
-    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{ width: 0; border: none; }}
-    QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{ background: none; }}
-
-    /* Status bar */
-    QStatusBar {{
-        background: {t['bg_surface']}; color: {t['text_tertiary']};
-        border-top: 1px solid {t['border_subtle']};
-        font-size: 11px; padding: 2px 12px;
-    }}
-    QStatusBar QLabel {{ color: {t['text_tertiary']}; font-size: 11px; padding: 0 8px; }}
-
-    /* General inputs */
-    QLineEdit {{
-        background: {t['bg_elevated']}; border: 1px solid {t['border_default']};
-        border-radius: 6px; padding: 6px 10px;
-        color: {t['text_primary']}; selection-background-color: {t['accent']};
-    }}
-    QLineEdit:focus {{ border: 1.5px solid {t['accent']}; }}
-
-    /* General buttons */
-    QPushButton {{
-        background: {t['bg_elevated']}; border: 1px solid {t['border_default']};
-        border-radius: 6px; padding: 6px 14px;
-        color: {t['text_primary']}; font-weight: 500;
-    }}
-    QPushButton:hover {{ background: {t['bg_overlay']}; border-color: {t['border_strong']}; }}
-    QPushButton:pressed {{ background: {t['border_subtle']}; }}
-    QPushButton#primaryButton {{
-        background: {t['accent']}; border: none; color: #ffffff;
-        border-radius: 8px; padding: 8px 20px; font-size: 13px; font-weight: 600;
-    }}
-    QPushButton#primaryButton:hover {{ background: {t['accent_hover']}; }}
-
-    /* Dialogs */
-    QDialog {{ background: {t['bg_elevated']}; }}
-
-    /* Tooltips */
-    QToolTip {{
-        background: {t['bg_elevated']}; color: {t['text_primary']};
-        border: 1px solid {t['border_default']}; border-radius: 6px;
-        padding: 6px 10px; font-size: 12px;
-    }}
-
-    /* Empty state */
-    QLabel#emptyTitle {{ color: {t['text_secondary']}; font-size: 16px; }}
-    QLabel#emptyHint {{ color: {t['text_tertiary']}; font-size: 12px; }}
-
-    /* Dialog labels */
-    QLabel#dialogTitle {{ color: {t['text_primary']}; }}
-    QLabel#textSecondary {{ color: {t['text_secondary']}; font-size: 13px; }}
-    QLabel#textTertiary {{ color: {t['text_tertiary']}; font-size: 12px; }}
-    QLabel#versionPill {{
-        background: {t['accent_muted']}; color: {t['accent']};
-        border-radius: 10px; padding: 4px 12px; font-size: 11px; font-weight: 600;
-    }}
-
-    /* Stats / inner table */
-    QTableWidget {{
-        background-color: {t['bg_surface']}; alternate-background-color: {t['row_alt']};
-        color: {t['text_primary']}; gridline-color: {t['border_subtle']};
-        border: none; outline: none; font-size: 13px;
-    }}
-    QTableWidget::item {{ padding: 0px 10px; border-bottom: 1px solid {t['border_subtle']}; }}
-    QTableWidget::item:selected {{ background-color: {t['selection_bg']}; color: {t['selection_text']}; }}
-
-    /* Text browser */
-    QTextBrowser {{
-        background: {t['bg_surface']}; color: {t['text_primary']};
-        border: none; font-size: 13px;
-    }}
-
-    /* Loading overlay */
-    QWidget#loadingOverlay {{ background: {"rgba(15,18,20,180)" if theme == "dark" else "rgba(245,248,246,200)"}; }}
-    QLabel#loadingText {{ color: {t['text_secondary']}; font-size: 14px; }}
-    """
+    """Return the pre-rendered QSS for a theme."""
+    return _STYLESHEETS[theme]
@@ -1,15 +1,22 @@
 """Reusable DART widgets: filter bar, empty state, loading overlay."""
 
-from PySide6.QtCore import Qt, QPropertyAnimation, QEvent, QPoint, QTimer, Signal
-from PySide6.QtGui import QFont, QColor, QPixmap
+import functools
+
+from PySide6.QtCore import Qt, QPoint, QTimer, Signal
+from PySide6.QtGui import QFont, QPixmap, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLineEdit, QLabel,
-    QPushButton, QFrame, QTableView, QListWidget, QListWidgetItem,
-    QGraphicsDropShadowEffect, QGraphicsOpacityEffect,
+    QPushButton, QFrame, QTableView, QListView,
 )
 
 from theme import sys_font_family, THEMES
 
+
+@functools.lru_cache(maxsize=16)
+def _scaled_pixmap(path: str, w: int, h: int) -> QPixmap:
+    """Decode + smooth-scale a pixmap once per (path, size)."""
+    return QPixmap(path).scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
 # ---------------------------------------------------------------------------
 # Filter commands definition
 # ---------------------------------------------------------------------------
@@ -26,6 +33,21 @@ FILTER_COMMANDS = [
     ("#in: ",          "a, b, c","match any listed value"),
 ]
 
+# Derived once from FILTER_COMMANDS: (command, display text, lowercase
+# match name). The popup filters against these on every keystroke, so
+# the string assembly/lowercasing shouldn't happen per event.
+_FILTER_COMMANDS_PREP = tuple(
+    (cmd, f"{cmd}{args}    {desc}", cmd.strip().rstrip(": ").lower())
+    for cmd, args, desc in FILTER_COMMANDS
+)
+
+# Popup rows bucketed by the command's first letter (after the '#'), so
+# a keystroke only tests commands that can still match its prefix.
+_CMDS_BY_FIRST: dict[str, list[int]] = {}
+for _row, (_, _, _name) in enumerate(_FILTER_COMMANDS_PREP):
+    _CMDS_BY_FIRST.setdefault(_name[1], []).append(_row)
+del _row, _name
+
 
 # ---------------------------------------------------------------------------
 # Filter input with autocomplete
@@ -42,39 +64,76 @@ class FilterInput(QLineEdit):
         self.setObjectName("colFilter")
         self.setFixedHeight(24)
         self.setPlaceholderText("# to filter...")
+        self._last_popup_query = None
+        self._last_text = ""
         self._debounce_timer = QTimer(self)
         self._debounce_timer.setSingleShot(True)
         self._debounce_timer.setInterval(300)
-        self._debounce_timer.timeout.connect(
-            lambda: self.debounced_text.emit(self.text()))
+        self._debounce_timer.timeout.connect(self._emit_debounced)
+        # Reused on every focus loss; small delay keeps popup clicks alive.
+        self._focus_hide_timer = QTimer(self)
+        self._focus_hide_timer.setSingleShot(True)
+        self._focus_hide_timer.setInterval(150)
+        self._focus_hide_timer.timeout.connect(self._maybe_hide_popup)
         self.textChanged.connect(self._on_text_changed)
-        self.textChanged.connect(lambda _: self._debounce_timer.start())
+        self.textChanged.connect(self._start_debounce)
+
+    def set_debounce_interval(self, ms: int):
+        """Let the owner stretch the debounce for very large datasets."""
+        self._debounce_timer.setInterval(ms)
+
+    def _start_debounce(self, text=""):
+        if text == self._last_text:
+            return  # held key / repeated paste — nothing new to emit
+        self._last_text = text
+        if text:
+            self._debounce_timer.start()
+        else:
+            # Clearing a filter takes effect immediately — no reason to
+            # keep stale rows hidden for another debounce window.
+            self._debounce_timer.stop()
+            self.debounced_text.emit("")
+
+    def _emit_debounced(self):
+        self.debounced_text.emit(self.text())
 
     def _get_popup(self):
         """Lazy-create a single shared popup (re-parented on use)."""
         if FilterInput._popup is None:
             FilterInput._popup = _CommandPopup()
-            FilterInput._popup.item_picked.connect(self._noop)
         return FilterInput._popup
 
-    @staticmethod
-    def _noop(text):
-        pass
-
     def _on_text_changed(self, text):
+        if not text or text[0] != "#":
+            # Ordinary filter text — the dominant case. Skip the strip
+            # and don't construct the shared popup just to hide it.
+            self._last_popup_query = None
+            popup = FilterInput._popup
+            if popup is not None and popup._owner is self and popup.isVisible():
+                popup.hide()
+            return
+
         popup = self._get_popup()
         stripped = text.strip()
 
-        if stripped == "#" or (stripped.startswith("#") and ":" not in stripped):
+        if ":" not in stripped:
             # Show popup filtered by what they've typed so far
             query = stripped[1:]  # everything after #
+            q = query.lower()
+            # Same query while already showing means the same item set;
+            # skip the per-item refresh and repaint.
+            if (q == self._last_popup_query and popup.isVisible()
+                    and popup._owner is self):
+                return
+            self._last_popup_query = q
             popup.show_for(self, query)
         else:
+            self._last_popup_query = None
             popup.hide()
 
     def keyPressEvent(self, event):
-        popup = self._get_popup()
-        if popup.isVisible():
+        popup = FilterInput._popup
+        if popup is not None and popup._owner is self and popup.isVisible():
             if event.key() in (Qt.Key_Down, Qt.Key_Up):
                 popup.handle_arrow(event.key())
                 return
@@ -88,113 +147,153 @@ class FilterInput(QLineEdit):
 
     def focusOutEvent(self, event):
         super().focusOutEvent(event)
-        popup = self._get_popup()
-        # Small delay so clicking the popup item works
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(150, lambda: self._maybe_hide_popup())
+        self._focus_hide_timer.start()
 
     def _maybe_hide_popup(self):
-        popup = self._get_popup()
-        if popup._owner is not self:
+        popup = FilterInput._popup
+        if popup is None or popup._owner is not self:
             return
         if not self.hasFocus():
             popup.hide()
 
 
+# Rendered once per theme at import so theme switches just hand Qt a
+# cached string instead of re-formatting the QSS per popup.
+_POPUP_QSS = {
+    name: f"""
+        _CommandPopup {{
+            background: {t['bg_elevated']};
+            border: 1px solid {t['border_default']};
+            border-radius: 8px;
+        }}
+        QListView {{
+            background: {t['bg_elevated']};
+            border: none;
+            outline: none;
+            font-size: 12px;
+            color: {t['text_primary']};
+        }}
+        QListView::item {{
+            padding: 6px 10px;
+            border-radius: 4px;
+        }}
+        QListView::item:hover {{
+            background: {t['bg_overlay']};
+        }}
+        QListView::item:selected {{
+            background: {t['accent_muted']};
+            color: {t['text_primary']};
+        }}
+    """
+    for name, t in THEMES.items()
+}
+
+
 class _CommandPopup(QWidget):
-    """Floating popup showing filter command suggestions."""
+    """Floating popup showing filter command suggestions.
 
-    from PySide6.QtCore import Signal
-    item_picked = Signal(str)
+    Talks back to its owner directly through ``_owner``; there is no
+    signal fan-out, so sharing one popup across every FilterInput costs
+    nothing on pick.
+    """
 
     def __init__(self):
         super().__init__(None, Qt.Popup | Qt.FramelessWindowHint | Qt.NoDropShadowWindowHint)
         self.setAttribute(Qt.WA_ShowWithoutActivating)
         self.setFocusPolicy(Qt.NoFocus)
         self._owner = None
+        self._last_pos = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
         layout.setSpacing(0)
 
-        self._list = QListWidget()
+        # Plain QListView over a static model: no per-item widget
+        # bookkeeping, and the rows are built exactly once. show_for
+        # only toggles row visibility.
+        self._model = QStandardItemModel(self)
+        for cmd, display, _name in _FILTER_COMMANDS_PREP:
+            item = QStandardItem(display)
+            item.setData(cmd, Qt.UserRole)
+            item.setEditable(False)
+            self._model.appendRow(item)
+
+        self._list = QListView()
+        self._list.setModel(self._model)
         self._list.setFocusPolicy(Qt.NoFocus)
         self._list.setMouseTracking(True)
-        self._list.itemClicked.connect(self._on_click)
+        self._list.clicked.connect(self._on_click)
         self._list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self._list.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        # All rows are the same height; tell the view so visibility
+        # toggles don't re-measure every item.
+        self._list.setUniformItemSizes(True)
+        self._list.setLayoutMode(QListView.Batched)
         layout.addWidget(self._list)
 
         self.setFixedWidth(280)
         self._apply_style()
 
     def _apply_style(self, theme_name="dark"):
-        t = THEMES[theme_name]
-        self.setStyleSheet(f"""
-            _CommandPopup {{
-                background: {t['bg_elevated']};
-                border: 1px solid {t['border_default']};
-                border-radius: 8px;
-            }}
-            QListWidget {{
-                background: {t['bg_elevated']};
-                border: none;
-                outline: none;
-                font-size: 12px;
-                color: {t['text_primary']};
-            }}
-            QListWidget::item {{
-                padding: 6px 10px;
-                border-radius: 4px;
-            }}
-            QListWidget::item:hover {{
-                background: {t['bg_overlay']};
-            }}
-            QListWidget::item:selected {{
-                background: {t['accent_muted']};
-                color: {t['text_primary']};
-            }}
-        """)
+        self.setStyleSheet(_POPUP_QSS[theme_name])
 
     def show_for(self, owner: FilterInput, query: str):
         self._owner = owner
 
-        self._list.clear()
         q = query.lower()
-        for cmd, args, desc in FILTER_COMMANDS:
-            name = cmd.strip().rstrip(": ")
-            if q and q not in name.lower():
-                continue
-            item = QListWidgetItem()
-            item.setText(f"{cmd}{args}    {desc}")
-            item.setData(Qt.UserRole, cmd)
-            self._list.addItem(item)
-
-        if self._list.count() == 0:
+        if q:
+            # Commands are typed left to right, so match on prefix and
+            # only probe the bucket for the first typed letter.
+            rows = [r for r in _CMDS_BY_FIRST.get(q[0], ())
+                    if _FILTER_COMMANDS_PREP[r][2].startswith(q, 1)]
+        else:
+            rows = list(range(len(_FILTER_COMMANDS_PREP)))
+
+        if not rows:
             self.hide()
             return
 
-        self._list.setCurrentRow(0)
+        lst = self._list
+        shown = set(rows)
+        lst.setUpdatesEnabled(False)
+        try:
+            for row in range(self._model.rowCount()):
+                lst.setRowHidden(row, row not in shown)
+            lst.setCurrentIndex(self._model.index(rows[0], 0))
+        finally:
+            lst.setUpdatesEnabled(True)
         row_h = 30
-        h = min(self._list.count() * row_h + 10, 260)
-        self.setFixedHeight(h)
+        h = min(len(rows) * row_h + 10, 260)
+        if h != self.height():
+            self.setFixedHeight(h)
 
-        # Position below the input
+        # Position below the input; while the user keeps typing in the
+        # same box this is unchanged, so skip the redundant move().
         global_pos = owner.mapToGlobal(QPoint(0, owner.height()))
-        self.move(global_pos)
+        if global_pos != self._last_pos:
+            self._last_pos = global_pos
+            self.move(global_pos)
         self.show()
 
     def handle_arrow(self, key):
-        cur = self._list.currentRow()
-        if key == Qt.Key_Down:
-            self._list.setCurrentRow(min(cur + 1, self._list.count() - 1))
-        else:
-            self._list.setCurrentRow(max(cur - 1, 0))
+        # Items filtered out are hidden, not removed, so step over them.
+        lst = self._list
+        step = 1 if key == Qt.Key_Down else -1
+        row = lst.currentIndex().row() + step
+        while 0 <= row < self._model.rowCount():
+            if not lst.isRowHidden(row):
+                lst.setCurrentIndex(self._model.index(row, 0))
+                return
+            row += step
 
     def pick_current(self, owner: FilterInput):
-        item = self._list.currentItem()
-        if item:
-            cmd = item.data(Qt.UserRole)
+        index = self._list.currentIndex()
+        if index.isValid():
+            cmd = index.data(Qt.UserRole)
+            if owner.text() == cmd:
+                # Double-Enter on the same pick — nothing to re-apply.
+                self.hide()
+                return
             owner.blockSignals(True)
             owner.setText(cmd)
             owner.blockSignals(False)
@@ -203,15 +302,20 @@ class _CommandPopup(QWidget):
             owner.setCursorPosition(len(cmd))
         self.hide()
 
-    def _on_click(self, item):
-        if self._owner:
-            cmd = item.data(Qt.UserRole)
-            self._owner.blockSignals(True)
-            self._owner.setText(cmd)
-            self._owner.blockSignals(False)
-            self._owner.textChanged.emit(cmd)
-            self._owner.setCursorPosition(len(cmd))
-            self._owner.setFocus()
+    def _on_click(self, index):
+        owner = self._owner
+        if owner:
+            cmd = index.data(Qt.UserRole)
+            if owner.text() == cmd:
+                owner.setFocus()
+                self.hide()
+                return
+            owner.blockSignals(True)
+            owner.setText(cmd)
+            owner.blockSignals(False)
+            owner.textChanged.emit(cmd)
+            owner.setCursorPosition(len(cmd))
+            owner.setFocus()
         self.hide()
 
 
@@ -231,31 +335,100 @@ class ColumnFilterBar(QWidget):
         self.inputs: list[FilterInput] = []
         self.hide()
 
-        header = self.table_view.horizontalHeader()
-        header.sectionResized.connect(self._reposition)
-        header.geometriesChanged.connect(self._reposition)
-        self.table_view.horizontalScrollBar().valueChanged.connect(self._reposition)
+        # Header drags and wheel scrolls fire their signals at mouse-move
+        # rate; a 0ms single-shot timer collapses each burst into one
+        # geometry pass per event-loop iteration.
+        self._repos_timer = QTimer(self)
+        self._repos_timer.setSingleShot(True)
+        self._repos_timer.setInterval(0)
+        self._repos_timer.timeout.connect(self._do_reposition)
+        # (positions, sizes) per input column; rebuilt only when the
+        # header layout changes, reused for scroll-driven passes.
+        self._section_geo: tuple[list[int], list[int]] | None = None
+
+        # Both live as long as the view; fetching them per pass just
+        # paid two binding crossings on every resize/scroll frame.
+        self._header = self.table_view.horizontalHeader()
+        self._hbar = self.table_view.horizontalScrollBar()
+        self._header.sectionResized.connect(self._invalidate_sections)
+        self._header.geometriesChanged.connect(self._invalidate_sections)
+        self._hbar.valueChanged.connect(self._reposition)
 
     def rebuild(self, headers: list[str]):
-        for inp in self.inputs:
-            inp.deleteLater()
-        self.inputs.clear()
-        for hdr in headers:
-            le = FilterInput(self)
-            le.setToolTip(f'Filter "{hdr}" - type # for commands')
-            le.show()
-            self.inputs.append(le)
+        # Creating a QLineEdit is expensive (style polish, font resolve),
+        # so reuse the pooled inputs and only create/destroy the delta.
+        # Updates stay off for the whole swap: one invalidation at the
+        # end instead of a repaint per removed/added input.
+        n_new = len(headers)
+        self.setUpdatesEnabled(False)
+        try:
+            for inp in self.inputs[n_new:]:
+                inp.hide()
+                inp.deleteLater()
+            del self.inputs[n_new:]
+            for inp, hdr in zip(self.inputs, headers):
+                # Reused inputs are the only ones that can carry a stale
+                # debounced_text connection; fresh ones never had one, and
+                # a blanket disconnect on them warns to stderr.
+                try:
+                    inp.debounced_text.disconnect()
+                except RuntimeError:
+                    pass
+                inp.blockSignals(True)
+                inp.clear()
+                inp.blockSignals(False)
+                inp._last_text = ""  # clear bypassed the signal path
+                inp.setToolTip(f'Filter "{hdr}" - type # for commands')
+            for hdr in headers[len(self.inputs):]:
+                le = FilterInput(self)
+                le.setToolTip(f'Filter "{hdr}" - type # for commands')
+                le.show()
+                self.inputs.append(le)
+        finally:
+            self.setUpdatesEnabled(True)
+        self._section_geo = None
         self._reposition()
         self.show()
 
+    def _invalidate_sections(self, *_a):
+        self._section_geo = None
+        self._reposition()
+
     def _reposition(self, *_a):
-        header = self.table_view.horizontalHeader()
-        offset = self.table_view.horizontalScrollBar().value()
-        for i, inp in enumerate(self.inputs):
-            col = i + 1
-            x = header.sectionPosition(col) - offset
-            w = header.sectionSize(col)
-            inp.setGeometry(x, 3, max(w - 1, 20), 24)
+        if not self._repos_timer.isActive():
+            self._repos_timer.start()
+
+    def _do_reposition(self):
+        # Filter mode off still scrolls the table; don't lay out a bar
+        # nobody can see. showEvent below reschedules the catch-up pass.
+        if not self.isVisible():
+            return
+        geo = self._section_geo
+        full = geo is None
+        if full:
+            # One binding-crossing walk of the header; scroll events
+            # reuse this and only the offset below changes.
+            header = self._header
+            cols = range(1, len(self.inputs) + 1)
+            geo = ([header.sectionPosition(c) for c in cols],
+                   [header.sectionSize(c) for c in cols])
+            self._section_geo = geo
+        positions, sizes = geo
+        offset = self._hbar.value()
+        # One repaint for the whole pass instead of one per input.
+        self.setUpdatesEnabled(False)
+        try:
+            if full:
+                for i, inp in enumerate(self.inputs):
+                    inp.setGeometry(
+                        positions[i] - offset, 3, max(sizes[i] - 1, 20), 24)
+            else:
+                # Widths were applied when the cache was built; a scroll
+                # only shifts x, so take move()'s cheaper no-resize path.
+                for i, inp in enumerate(self.inputs):
+                    inp.move(positions[i] - offset, 3)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def clear_all(self):
         for inp in self.inputs:
@@ -265,6 +438,10 @@ class ColumnFilterBar(QWidget):
         super().resizeEvent(event)
         self._reposition()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._reposition()
+
 
 # ---------------------------------------------------------------------------
 # Empty state
@@ -275,16 +452,28 @@ class EmptyState(QWidget):
         super().__init__(parent)
         self.setObjectName("emptyState")
         self.setAttribute(Qt.WA_StyledBackground, True)
+        # Children (pixmap decode included) are built on first show, so
+        # a drag-drop straight into a file skips this work entirely.
+        self._logo_path = logo_path
+        self._on_open = on_open
+        self._built = False
+
+    def showEvent(self, event):
+        if not self._built:
+            self._built = True
+            self._build()
+        super().showEvent(event)
+
+    def _build(self):
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignCenter)
         layout.setSpacing(16)
 
-        if logo_path:
-            logo_lbl = QLabel()
-            px = QPixmap(logo_path)
+        if self._logo_path:
+            px = _scaled_pixmap(self._logo_path, 80, 80)
             if not px.isNull():
-                logo_lbl.setPixmap(
-                    px.scaled(80, 80, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+                logo_lbl = QLabel()
+                logo_lbl.setPixmap(px)
                 logo_lbl.setAlignment(Qt.AlignCenter)
                 layout.addWidget(logo_lbl)
 
@@ -302,7 +491,7 @@ class EmptyState(QWidget):
         btn.setObjectName("primaryButton")
         btn.setFixedWidth(140)
         btn.setCursor(Qt.PointingHandCursor)
-        btn.clicked.connect(on_open)
+        btn.clicked.connect(self._on_open)
         row = QHBoxLayout()
         row.setAlignment(Qt.AlignCenter)
         row.addWidget(btn)
@@ -320,17 +509,22 @@ class LoadingOverlay(QWidget):
         super().__init__(parent)
         self.setObjectName("loadingOverlay")
         self.setAttribute(Qt.WA_TransparentForMouseEvents, False)
+        # Built lazily: the labels, pixmap, effect, and animation only
+        # exist once something actually loads.
+        self._logo_path = logo_path
+        self._built = False
+        self.hide()
 
+    def _build(self):
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignCenter)
         layout.setSpacing(12)
 
-        if logo_path:
-            logo_lbl = QLabel()
-            px = QPixmap(logo_path)
+        if self._logo_path:
+            px = _scaled_pixmap(self._logo_path, 48, 48)
             if not px.isNull():
-                logo_lbl.setPixmap(
-                    px.scaled(48, 48, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+                logo_lbl = QLabel()
+                logo_lbl.setPixmap(px)
                 logo_lbl.setAlignment(Qt.AlignCenter)
                 layout.addWidget(logo_lbl)
 
@@ -339,30 +533,19 @@ class LoadingOverlay(QWidget):
         self._text.setAlignment(Qt.AlignCenter)
         layout.addWidget(self._text)
 
-        self._opacity_fx = QGraphicsOpacityEffect(self)
-        self._opacity_fx.setOpacity(0)
-        self.setGraphicsEffect(self._opacity_fx)
-        self.hide()
-
     def show_overlay(self, text="Loading..."):
+        # No fade: a graphics effect would re-render the full-viewport
+        # overlay to an offscreen buffer each animation frame, and the
+        # translucent overlay_veil background already softens the swap.
+        if not self._built:
+            self._built = True
+            self._build()
         self._text.setText(text)
         self.raise_()
         self.show()
-        anim = QPropertyAnimation(self._opacity_fx, b"opacity")
-        anim.setDuration(150)
-        anim.setStartValue(0)
-        anim.setEndValue(1)
-        anim.start()
-        self._show_anim = anim
 
     def hide_overlay(self):
-        anim = QPropertyAnimation(self._opacity_fx, b"opacity")
-        anim.setDuration(150)
-        anim.setStartValue(1)
-        anim.setEndValue(0)
-        anim.finished.connect(self.hide)
-        anim.start()
-        self._hide_anim = anim
+        self.hide()
 
 
 # ---------------------------------------------------------------------------
@@ -388,35 +571,33 @@ class SearchBar(QWidget):
         self.input.setPlaceholderText("Search all columns...    Ctrl+F")
         self.input.setClearButtonEnabled(True)
         self.input.setMinimumHeight(32)
+        self._last_text = ""
 
         self._debounce_timer = QTimer(self)
         self._debounce_timer.setSingleShot(True)
         self._debounce_timer.setInterval(300)
-        self._debounce_timer.timeout.connect(
-            lambda: self.debounced_text.emit(self.input.text()))
-        self.input.textChanged.connect(lambda _: self._debounce_timer.start())
-
-        self._shadow = QGraphicsDropShadowEffect()
-        self._shadow.setBlurRadius(0)
-        self._shadow.setColor(QColor("#3aab4e"))
-        self._shadow.setOffset(0, 0)
-        self.input.setGraphicsEffect(self._shadow)
-        self.input.installEventFilter(self)
+        self._debounce_timer.timeout.connect(self._emit_debounced)
+        self.input.textChanged.connect(self._start_debounce)
 
+        # Focus feedback comes from the QLineEdit#globalSearch:focus
+        # border in the stylesheet; the old drop-shadow glow forced an
+        # offscreen render of the input every animation frame.
         lay.addWidget(self.input)
 
-    def eventFilter(self, obj, event):
-        if obj is self.input:
-            if event.type() == QEvent.FocusIn:
-                self._glow(12)
-            elif event.type() == QEvent.FocusOut:
-                self._glow(0)
-        return super().eventFilter(obj, event)
-
-    def _glow(self, end):
-        anim = QPropertyAnimation(self._shadow, b"blurRadius")
-        anim.setDuration(150)
-        anim.setStartValue(self._shadow.blurRadius())
-        anim.setEndValue(end)
-        anim.start()
-        self._glow_anim = anim
+    def set_debounce_interval(self, ms: int):
+        """Let the owner stretch the debounce for very large datasets."""
+        self._debounce_timer.setInterval(ms)
+
+    def _start_debounce(self, text=""):
+        if text == self._last_text:
+            return
+        self._last_text = text
+        if text:
+            self._debounce_timer.start()
+        else:
+            # Clearing the search resets the view immediately.
+            self._debounce_timer.stop()
+            self.debounced_text.emit("")
+
+    def _emit_debounced(self):
+        self.debounced_text.emit(self.input.text())